@@ -7,16 +7,69 @@ Demonstrates Python subprocess management, output parsing, and reporting.
 """
 
 import argparse
+import array
+import codecs
+import hashlib
+import heapq
+import json
+import os
 import subprocess
 import sys
 import re
+import signal
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from enum import Enum
 
 
+# Patterns are matched with finditer over whole blocks of output, so they
+# are anchored to line starts with re.MULTILINE
+
+# Pattern: [       OK ] TestSuite.TestName (123 ms)
+# Pattern: [  FAILED  ] TestSuite.TestName (123 ms)
+TEST_PATTERN = re.compile(r'^\[\s+(OK|FAILED)\s+\]\s+(\w+)\.(\w+)\s+\((\d+)\s+ms\)', re.MULTILINE)
+
+# Summary lines: [  PASSED  ] 22 tests.  /  [  FAILED  ] 1 test, listed below:
+SUMMARY_PATTERN = re.compile(r'^\[\s+PASSED\s+\]\s+(\d+)\s+tests?', re.MULTILINE)
+FAILED_PATTERN = re.compile(r'^\[\s+FAILED\s+\]\s+(\d+)\s+tests?', re.MULTILINE)
+
+# Upper bound on how much test output is read from the pipe at once
+READ_CHUNK_SIZE = 64 * 1024
+
+# Summary of the most recent run, written to the build directory
+LAST_RUN_FILE = 'last_test_run.json'
+
+# Results of passing runs, keyed by the SHA-256 of the test executable
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'vinci' / 'tests'
+
+
+def _read_line_blocks(stream) -> Iterator[str]:
+    """Yield decoded output as it arrives, in blocks of complete lines"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    # Pieces of an unfinished line; joined only once its newline arrives so
+    # long lines are not recopied for every chunk
+    parts = []
+    while block := stream.read1(READ_CHUNK_SIZE):
+        text = decoder.decode(block)
+        cut = text.rfind('\n') + 1
+        if not cut:
+            parts.append(text)
+            continue
+
+        parts.append(text[:cut])
+        yield ''.join(parts)
+        parts = [text[cut:]]
+
+    parts.append(decoder.decode(b'', final=True))
+    tail = ''.join(parts)
+    if tail:
+        yield tail
+
+
 class TestStatus(Enum):
     """Test execution status"""
     PASSED = "PASSED"
@@ -46,7 +99,7 @@ class Color:
         Color.RESET = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Individual test result"""
     suite: str
@@ -59,7 +112,7 @@ class TestResult:
         return f"{self.suite}.{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSummary:
     """Overall test run summary"""
     total_tests: int
@@ -67,7 +120,66 @@ class TestSummary:
     failed: int
     skipped: int
     total_duration_ms: int
-    test_results: List[TestResult]
+    # Per-test data is stored column-wise: index i of each sequence
+    # describes the same test
+    full_names: List[str]
+    durations_ms: array.array
+    passed_mask: bytearray
+    # Exit status of the test executable; non-zero with no failed tests
+    # means it crashed or was killed partway through
+    exit_code: int
+
+    @property
+    def succeeded(self) -> bool:
+        """True if no test failed and the executable exited cleanly"""
+        return self.exit_code == 0 and self.failed == 0
+
+    @property
+    def test_results(self) -> List[TestResult]:
+        """Per-test results rebuilt as TestResult objects"""
+        results = []
+        for full_name, duration, ok in zip(self.full_names, self.durations_ms, self.passed_mask):
+            suite, _, name = full_name.partition('.')
+            results.append(TestResult(
+                suite=suite,
+                name=name,
+                status=TestStatus.PASSED if ok else TestStatus.FAILED,
+                duration_ms=duration
+            ))
+        return results
+
+    def to_dict(self) -> dict:
+        """JSON-serializable representation"""
+        return {
+            'total_tests': self.total_tests,
+            'passed': self.passed,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'total_duration_ms': self.total_duration_ms,
+            'full_names': self.full_names,
+            'durations_ms': self.durations_ms.tolist(),
+            'passed_mask': list(self.passed_mask),
+            'exit_code': self.exit_code,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TestSummary':
+        """Inverse of to_dict"""
+        return cls(
+            total_tests=data['total_tests'],
+            passed=data['passed'],
+            failed=data['failed'],
+            skipped=data['skipped'],
+            total_duration_ms=data['total_duration_ms'],
+            full_names=list(data['full_names']),
+            durations_ms=array.array('i', data['durations_ms']),
+            passed_mask=bytearray(data['passed_mask']),
+            exit_code=data['exit_code']
+        )
+
+
+class TestTimeoutError(Exception):
+    """A test process ran past the time limit"""
 
 
 class TestRunner:
@@ -77,6 +189,12 @@ class TestRunner:
         self.build_dir = build_dir
         self.verbose = verbose
         self.root_dir = build_dir.parent
+        self.test_executable = (build_dir / 'tree_tests').resolve()
+
+        # Test processes still running, and a flag telling shards that are
+        # about to start to stop instead, so an interrupt can end them all
+        self._running: List[subprocess.Popen] = []
+        self._stopping = threading.Event()
 
         if no_color or not sys.stdout.isatty():
             Color.disable()
@@ -86,31 +204,39 @@ class TestRunner:
         print(f"{Color.BLUE}Building tests...{Color.RESET}")
         start_time = time.time()
 
+        cmd = ['cmake', '--build', str(self.build_dir), '--parallel', str(os.cpu_count() or 1)]
+
         try:
+            # stdout (progress lines) is only shown in verbose mode; stderr
+            # always carries the diagnostics to show if the build fails
             result = subprocess.run(
-                ['cmake', '--build', str(self.build_dir)],
+                cmd,
                 cwd=self.root_dir,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE if self.verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=False
             )
 
             build_time = time.time() - start_time
 
+            if self.verbose and result.stdout:
+                print(result.stdout.decode(errors='replace'), end='')
+
             if result.returncode != 0:
                 print(f"{Color.RED}✗ Build failed{Color.RESET} ({build_time:.1f}s)")
-                if self.verbose or result.returncode != 0:
-                    print(result.stderr)
+                print(result.stderr.decode(errors='replace'))
                 return False
 
-            # Check for warnings
-            warnings = [line for line in result.stderr.split('\n') if 'warning:' in line.lower()]
+            # Warnings are only listed in verbose mode, so skip the scan
+            # otherwise. stderr stays as bytes; 'warning:' is plain ASCII
+            warnings = None
+            if self.verbose:
+                warnings = [line for line in result.stderr.splitlines() if b'warning:' in line.lower()]
 
             if warnings:
                 print(f"{Color.YELLOW}✓ Build succeeded with {len(warnings)} warning(s){Color.RESET} ({build_time:.1f}s)")
-                if self.verbose:
-                    for warning in warnings:
-                        print(f"  {warning}")
+                for warning in warnings:
+                    print(f"  {warning.decode(errors='replace')}")
             else:
                 print(f"{Color.GREEN}✓ Build succeeded{Color.RESET} ({build_time:.1f}s)")
 
@@ -125,130 +251,340 @@ class TestRunner:
 
     def run_tests(self, filter_pattern: Optional[str] = None) -> Optional[TestSummary]:
         """Run the test executable and parse results"""
-        # Use absolute path resolution
-        test_executable = (self.root_dir / self.build_dir / 'tree_tests').resolve()
-
-        if not test_executable.exists():
-            print(f"{Color.RED}Error: Test executable not found at {test_executable}{Color.RESET}")
-            return None
-
         print(f"\n{Color.BLUE}Running tests...{Color.RESET}")
 
         # Build command
-        cmd = [str(test_executable)]
+        cmd = [str(self.test_executable)]
         if filter_pattern:
             cmd.append(f'--gtest_filter={filter_pattern}')
             print(f"{Color.CYAN}Filter: {filter_pattern}{Color.RESET}")
 
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.build_dir,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
-
-            # Show full output in verbose mode
-            if self.verbose:
-                print(f"\n{Color.CYAN}{'='*70}{Color.RESET}")
-                print(result.stdout)
-                if result.stderr:
-                    print(result.stderr)
-                print(f"{Color.CYAN}{'='*70}{Color.RESET}\n")
+        # Filtered runs stay in one process so their output order is
+        # deterministic; full runs are split into gtest shards run concurrently
+        shards = 1 if filter_pattern else (os.cpu_count() or 1)
 
-            return self._parse_test_output(result.stdout, result.stderr)
+        if self.verbose:
+            print(f"\n{Color.CYAN}{'='*70}{Color.RESET}")
 
-        except subprocess.TimeoutExpired:
+        # A missing executable surfaces as FileNotFoundError from the launch
+        # itself rather than from a separate existence check. Timeouts are
+        # raised by the shards so they are reported once here
+        try:
+            if shards == 1:
+                summaries = [self._run_shard(cmd)]
+            else:
+                pool = ThreadPoolExecutor(max_workers=shards)
+                try:
+                    summaries = list(pool.map(
+                        lambda index: self._run_shard(cmd, self._shard_env(index, shards)),
+                        range(shards)
+                    ))
+                except BaseException:
+                    # Shards run in their own sessions and never see Ctrl-C;
+                    # kill them so shutdown doesn't wait out the full run
+                    self._stopping.set()
+                    for proc in list(self._running):
+                        self._kill_process_group(proc)
+                    raise
+                finally:
+                    pool.shutdown(cancel_futures=True)
+        except FileNotFoundError:
+            print(f"{Color.RED}Error: Test executable not found at {self.test_executable}{Color.RESET}")
+            return None
+        except TestTimeoutError:
             print(f"{Color.RED}Error: Tests timed out after 120 seconds{Color.RESET}")
             return None
+
+        if self.verbose:
+            print(f"{Color.CYAN}{'='*70}{Color.RESET}\n")
+
+        if any(summary is None for summary in summaries):
+            return None
+
+        return self._merge_summaries(summaries)
+
+    @staticmethod
+    def _shard_env(index: int, total: int) -> Dict[str, str]:
+        """Environment selecting one gtest shard"""
+        env = dict(os.environ)
+        env['GTEST_TOTAL_SHARDS'] = str(total)
+        env['GTEST_SHARD_INDEX'] = str(index)
+        return env
+
+    def _run_shard(self, cmd: List[str], env: Optional[Dict[str, str]] = None) -> Optional[TestSummary]:
+        """Run one test process and parse its output"""
+        try:
+            # Stream output into the parser as it arrives instead of buffering
+            # the whole run. stderr is merged so a full stderr pipe can't stall
+            # the child while we are blocked reading stdout. The child gets its
+            # own session so anything it forks (death tests, helpers) can be
+            # killed with it; otherwise those keep the pipe open
+            proc = subprocess.Popen(
+                cmd,
+                cwd=self.build_dir,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                start_new_session=True
+            )
+            self._running.append(proc)
+            if self._stopping.is_set():
+                self._kill_process_group(proc)
+
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                self._kill_process_group(proc)
+
+            timer = threading.Timer(120, kill)  # 2 minute timeout
+            timer.start()
+
+            try:
+                with proc:
+                    blocks = _read_line_blocks(proc.stdout)
+                    if self.verbose:
+                        blocks = self._echo(blocks)
+                    summary = self._parse_test_output(blocks)
+            except BaseException:
+                self._kill_process_group(proc)
+                raise
+            finally:
+                timer.cancel()
+                self._running.remove(proc)
+
+            if timed_out.is_set():
+                raise TestTimeoutError()
+
+            summary.exit_code = proc.returncode
+            return summary
+
+        except (FileNotFoundError, TestTimeoutError):
+            raise
         except Exception as e:
             print(f"{Color.RED}Error running tests: {e}{Color.RESET}")
             return None
 
-    def _parse_test_output(self, stdout: str, stderr: str) -> TestSummary:
-        """Parse Google Test output format"""
-        test_results = []
+    @staticmethod
+    def _kill_process_group(proc: subprocess.Popen):
+        """Kill a test process and everything it started"""
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
-        # Pattern: [       OK ] TestSuite.TestName (123 ms)
-        # Pattern: [  FAILED  ] TestSuite.TestName (123 ms)
-        test_pattern = re.compile(r'\[\s+(OK|FAILED)\s+\]\s+(\w+)\.(\w+)\s+\((\d+)\s+ms\)')
+    @staticmethod
+    def _merge_summaries(summaries: List[TestSummary]) -> TestSummary:
+        """Combine per-shard summaries into one"""
+        if len(summaries) == 1:
+            return summaries[0]
+
+        full_names = []
+        durations_ms = array.array('i')
+        passed_mask = bytearray()
+        for summary in summaries:
+            full_names.extend(summary.full_names)
+            durations_ms.extend(summary.durations_ms)
+            passed_mask.extend(summary.passed_mask)
 
-        for line in stdout.split('\n'):
-            match = test_pattern.search(line)
-            if match:
-                status_str, suite, name, duration = match.groups()
-                status = TestStatus.PASSED if status_str == 'OK' else TestStatus.FAILED
-                test_results.append(TestResult(
-                    suite=suite,
-                    name=name,
-                    status=status,
-                    duration_ms=int(duration)
-                ))
-
-        # Parse summary line: [  PASSED  ] 22 tests.
-        summary_pattern = re.compile(r'\[\s+PASSED\s+\]\s+(\d+)\s+tests?')
-        failed_pattern = re.compile(r'\[\s+FAILED\s+\]\s+(\d+)\s+tests?')
+        return TestSummary(
+            total_tests=sum(s.total_tests for s in summaries),
+            passed=sum(s.passed for s in summaries),
+            failed=sum(s.failed for s in summaries),
+            skipped=sum(s.skipped for s in summaries),
+            total_duration_ms=sum(s.total_duration_ms for s in summaries),
+            full_names=full_names,
+            durations_ms=durations_ms,
+            passed_mask=passed_mask,
+            exit_code=next((s.exit_code for s in summaries if s.exit_code != 0), 0)
+        )
 
+    @staticmethod
+    def _echo(blocks: Iterable[str]) -> Iterator[str]:
+        """Pass output through while showing it live (verbose mode)"""
+        for block in blocks:
+            print(block, end='', flush=True)
+            yield block
+
+    def _parse_test_output(self, blocks: Iterable[str]) -> TestSummary:
+        """Parse Google Test output format.
+
+        Consumes the output incrementally; each block must end on a line
+        boundary (a single line or the whole output both work).
+        """
+        full_names = []
+        durations_ms = array.array('i')
+        passed_mask = bytearray()
         passed = 0
         failed = 0
 
-        for line in stdout.split('\n'):
-            if match := summary_pattern.search(line):
-                passed = int(match.group(1))
-            if match := failed_pattern.search(line):
-                failed = int(match.group(1))
+        # Hoist per-match attribute lookups out of the loop
+        add_name = full_names.append
+        add_duration = durations_ms.append
+        add_status = passed_mask.append
+        find_tests = TEST_PATTERN.finditer
+        find_passed = SUMMARY_PATTERN.finditer
+        find_failed = FAILED_PATTERN.finditer
+
+        # The regex engine walks each block in C; only matching lines ever
+        # become Python objects
+        for block in blocks:
+            for match in find_tests(block):
+                status_str, suite, name, duration = match.groups()
+                add_name(f"{suite}.{name}")
+                add_duration(int(duration))
+                add_status(status_str == 'OK')
 
-        total_duration = sum(test.duration_ms for test in test_results)
+            if 'PASSED' in block:
+                for match in find_passed(block):
+                    passed = int(match.group(1))
+            if 'FAILED' in block:
+                for match in find_failed(block):
+                    failed = int(match.group(1))
 
         return TestSummary(
-            total_tests=len(test_results),
+            total_tests=len(full_names),
             passed=passed,
             failed=failed,
             skipped=0,
-            total_duration_ms=total_duration,
-            test_results=test_results
+            total_duration_ms=sum(durations_ms),
+            full_names=full_names,
+            durations_ms=durations_ms,
+            passed_mask=passed_mask,
+            exit_code=0
         )
 
+    def save_last_run(self, summary: TestSummary):
+        """Write the summary to the build directory for other tools to read"""
+        try:
+            (self.build_dir / LAST_RUN_FILE).write_text(json.dumps(summary.to_dict()))
+        except OSError as e:
+            print(f"{Color.YELLOW}Warning: could not write {LAST_RUN_FILE}: {e}{Color.RESET}")
+
+    def load_cached_summary(self, filter_pattern: Optional[str] = None) -> Optional[TestSummary]:
+        """Return the summary of a previous passing run of the same executable"""
+        cache_file = self._cache_file(filter_pattern)
+        if cache_file is None:
+            return None
+
+        try:
+            return TestSummary.from_dict(json.loads(cache_file.read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save_cached_summary(self, summary: TestSummary, filter_pattern: Optional[str] = None):
+        """Remember a passing run so an unchanged executable can skip it next time"""
+        if not summary.succeeded:
+            return
+
+        cache_file = self._cache_file(filter_pattern)
+        if cache_file is None:
+            return
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(summary.to_dict()))
+        except OSError as e:
+            print(f"{Color.YELLOW}Warning: could not write test cache: {e}{Color.RESET}")
+
+    def _cache_file(self, filter_pattern: Optional[str]) -> Optional[Path]:
+        """Cache entry for the current executable and filter"""
+        digest = self._executable_digest(self.test_executable)
+        if digest is None:
+            return None
+
+        if filter_pattern:
+            digest += '-' + hashlib.sha256(filter_pattern.encode()).hexdigest()[:16]
+        return CACHE_DIR / f'{digest}.json'
+
+    @staticmethod
+    def _executable_digest(executable: Path) -> Optional[str]:
+        """SHA-256 of the executable.
+
+        The digest is remembered alongside the file's mtime and size so an
+        untouched binary does not have to be re-read on every run.
+        """
+        try:
+            stat = executable.stat()
+        except OSError:
+            return None
+
+        index_file = CACHE_DIR / 'index.json'
+        try:
+            index = json.loads(index_file.read_text())
+        except (OSError, ValueError):
+            index = {}
+
+        key = str(executable)
+        entry = index.get(key)
+        if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+            return entry['sha256']
+
+        sha = hashlib.sha256()
+        try:
+            with open(executable, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    sha.update(chunk)
+        except OSError:
+            return None
+        digest = sha.hexdigest()
+
+        index[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            index_file.write_text(json.dumps(index))
+        except OSError:
+            pass
+
+        return digest
+
     def print_summary(self, summary: TestSummary):
         """Print formatted test summary"""
-        print(f"\n{Color.BOLD}{'='*70}{Color.RESET}")
-        print(f"{Color.BOLD}Test Summary{Color.RESET}")
-        print(f"{Color.BOLD}{'='*70}{Color.RESET}")
+        # Color codes are fixed once TestRunner is set up; read them once
+        green, red, cyan, bold, reset = Color.GREEN, Color.RED, Color.CYAN, Color.BOLD, Color.RESET
+
+        print(f"\n{bold}{'='*70}{reset}")
+        print(f"{bold}Test Summary{reset}")
+        print(f"{bold}{'='*70}{reset}")
 
         # Overall status
-        if summary.failed == 0:
-            status_color = Color.GREEN
+        if summary.succeeded:
+            status_color = green
             status_icon = "✓"
         else:
-            status_color = Color.RED
+            status_color = red
             status_icon = "✗"
 
-        print(f"\n{status_color}{status_icon} Total: {summary.total_tests} tests{Color.RESET}")
-        print(f"  {Color.GREEN}Passed: {summary.passed}{Color.RESET}")
+        print(f"\n{status_color}{status_icon} Total: {summary.total_tests} tests{reset}")
+        print(f"  {green}Passed: {summary.passed}{reset}")
 
         if summary.failed > 0:
-            print(f"  {Color.RED}Failed: {summary.failed}{Color.RESET}")
+            print(f"  {red}Failed: {summary.failed}{reset}")
+
+        if summary.exit_code != 0:
+            print(f"  {red}Test executable exited with code {summary.exit_code}{reset}")
 
         # Duration breakdown
-        print(f"\n{Color.CYAN}Duration: {summary.total_duration_ms/1000:.1f}s total{Color.RESET}")
+        print(f"\n{cyan}Duration: {summary.total_duration_ms/1000:.1f}s total{reset}")
 
         # Show slowest tests
-        if summary.test_results:
-            slowest = sorted(summary.test_results, key=lambda t: t.duration_ms, reverse=True)[:5]
-            print(f"\n{Color.BOLD}Slowest tests:{Color.RESET}")
-            for test in slowest:
-                duration_sec = test.duration_ms / 1000
-                print(f"  {test.full_name:.<50} {duration_sec:>6.1f}s")
+        names = summary.full_names
+        durations = summary.durations_ms
+        if names:
+            slowest = heapq.nlargest(5, range(len(durations)), key=durations.__getitem__)
+            print(f"\n{bold}Slowest tests:{reset}")
+            for i in slowest:
+                duration_sec = durations[i] / 1000
+                print(f"  {names[i]:.<50} {duration_sec:>6.1f}s")
 
         # Show failed tests
-        failed_tests = [t for t in summary.test_results if t.status == TestStatus.FAILED]
+        failed_tests = [name for name, ok in zip(names, summary.passed_mask) if not ok]
         if failed_tests:
-            print(f"\n{Color.RED}{Color.BOLD}Failed tests:{Color.RESET}")
-            for test in failed_tests:
-                print(f"  {Color.RED}✗ {test.full_name}{Color.RESET}")
+            print(f"\n{red}{bold}Failed tests:{reset}")
+            for name in failed_tests:
+                print(f"  {red}✗ {name}{reset}")
 
-        print(f"\n{Color.BOLD}{'='*70}{Color.RESET}\n")
+        print(f"\n{bold}{'='*70}{reset}\n")
 
 
 def main():
@@ -262,6 +598,7 @@ Examples:
   %(prog)s --filter "*OEIS*"        # Run only OEIS tests
   %(prog)s --no-build               # Skip build, just run tests
   %(prog)s --verbose                # Show detailed output
+  %(prog)s --cache                  # Reuse results if the test binary is unchanged
         """
     )
 
@@ -296,6 +633,13 @@ Examples:
         help='Disable colored output'
     )
 
+    parser.add_argument(
+        '--cache',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Skip running tests when an unchanged test executable already passed'
+    )
+
     args = parser.parse_args()
 
     # Validate build directory
@@ -311,17 +655,29 @@ Examples:
         if not runner.build_tests():
             return 1
 
+    # Cached results from an identical executable
+    if args.cache:
+        summary = runner.load_cached_summary(filter_pattern=args.filter)
+        if summary is not None:
+            print(f"\n{Color.CYAN}Test executable unchanged, using cached results{Color.RESET}")
+            runner.print_summary(summary)
+            return 0
+
     # Test phase
     summary = runner.run_tests(filter_pattern=args.filter)
 
     if summary is None:
         return 1
 
+    if args.cache:
+        runner.save_cached_summary(summary, filter_pattern=args.filter)
+
     # Report results
     runner.print_summary(summary)
+    runner.save_last_run(summary)
 
     # Exit with appropriate code
-    return 0 if summary.failed == 0 else 1
+    return 0 if summary.succeeded else 1
 
 
 if __name__ == '__main__':